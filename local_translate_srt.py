@@ -7,9 +7,13 @@ Usage:
   python3 local_translate_srt.py /path/to/input_dir /path/to/output_dir --src en --tgt es --backend google
 
 Backends supported (pick one with --backend):
-  - google  : uses deep-translator's GoogleTranslator (no API key; may rate-limit)
-  - libre   : uses LibreTranslate (needs --libre-url, optionally --libre-api-key)
-  - deepl   : uses DeepL API (needs env DEEPL_API_KEY or --deepl-api-key)
+  - google       : uses deep-translator's GoogleTranslator (no API key; may rate-limit)
+  - google-async : talks to Google's free endpoint directly with aiohttp; lines in a
+                   batch are translated concurrently over one keep-alive connection
+  - libre        : uses LibreTranslate (needs --libre-url, optionally --libre-api-key)
+  - deepl        : uses DeepL API (needs env DEEPL_API_KEY or --deepl-api-key)
+  - pool         : dispatches across google + mymemory (+ libre/deepl when
+                   configured), each with its own rate budget
   
 Notes:
   * Preserves timing and formatting. Only subtitle text is translated.
@@ -18,21 +22,204 @@ Notes:
 """
 
 import argparse
+import concurrent.futures
+import functools
+import hashlib
+import mmap
 import os
+import queue
+import random
 import re
+import sqlite3
 import sys
+import threading
 import time
 from pathlib import Path
 
 # Optional imports handled lazily
 TranslatorImpl = None
 
-SRT_BLOCK_RE = re.compile(r"""(?mx)
+# Shared cross-file batching dispatcher; configured by main(), None disables it.
+DISPATCHER = None
+
+# Proactive rate limiter shared by every worker; None falls back to fixed sleeps.
+RATE_LIMITER = None
+
+# Persistent translation cache; configured by load_translator, None disables it.
+CACHE = None
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "subtitles-srt-bridge" / "translations.sqlite3"
+
+# SYMBOL FOR RECORD SEPARATOR (U+241E): Google and DeepL return it verbatim,
+# so a whole batch can ride in one request and be split back afterwards.
+BATCH_MARKER = "\n␞\n"
+# The char budget is the real packing bound — short dialogue cues ("- Yeah?")
+# coalesce by the dozens into one request. Google's anonymous endpoint rejects
+# payloads around 5000 chars, so stay under it; the line cap is just a guard
+# against degenerate inputs.
+MAX_BATCH_LINES = 100
+MAX_BATCH_CHARS = 4500
+
+_SRT_BLOCK_PATTERN = r"""
     (\d+)\s*\n          # index
     (\d\d:\d\d:\d\d,\d{3})\s+-->\s+(\d\d:\d\d:\d\d,\d{3})\s*\n  # timestamp
     (.*?)                  # text (can be multi-line)
     (?=\n\n|\Z)         # until blank line or EOF
-""")
+"""
+SRT_BLOCK_RE = re.compile(_SRT_BLOCK_PATTERN, re.M | re.X | re.S)
+
+# Lines with no letters at all (music marks, dashes, bare numbers, pure
+# punctuation) read the same in every language; don't spend a request on them.
+NOOP_LINE_RE = re.compile(r"^[\W\d_]*$")
+# Bytes twin of the pattern: matching over bytes skips per-char str indexing
+# and lets us decode only the text group that actually travels to a backend.
+SRT_BLOCK_RE_B = re.compile(_SRT_BLOCK_PATTERN.encode("ascii"), re.M | re.X | re.S)
+# Block separator tolerant of CRLF, matched against the raw (possibly
+# memory-mapped) input so chunks can be carved out one at a time.
+BLOCK_SEP_RE_B = re.compile(rb"\r?\n\r?\n")
+
+class TokenBucket:
+    """Proactive request throttle: callers wait only when the bucket is empty.
+
+    Unlike the old unconditional post-request sleep, fast responses spend no
+    idle time as long as tokens remain. On a provider 429 the rate is halved
+    (AIMD) and climbs back toward the configured rate in doubling steps.
+    """
+
+    RECOVERY_INTERVAL = 30.0
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self._base_rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._recover_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            if self.rate < self._base_rate and now >= self._recover_at:
+                self.rate = min(self._base_rate, self.rate * 2)
+                self._recover_at = now + self.RECOVERY_INTERVAL
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            # Negative balance is the debt the caller sleeps off outside the lock.
+            wait = max(0.0, -self._tokens / self.rate)
+        if wait > 0:
+            time.sleep(wait)
+
+    def available(self):
+        """Current token balance without consuming anything."""
+        with self._lock:
+            now = time.monotonic()
+            return min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+
+    def throttle(self):
+        with self._lock:
+            self.rate = max(self._base_rate / 8, self.rate / 2)
+            self._recover_at = time.monotonic() + self.RECOVERY_INTERVAL
+
+
+def _is_rate_limit_error(exc):
+    text = f"{type(exc).__name__} {exc}".lower()
+    return "429" in text or "too many requests" in text
+
+
+# Status codes only count when they stand alone; a bare substring match would
+# turn "503 after 4004 bytes" or a URL into a spurious client error.
+_CLIENT_ERROR_RE = re.compile(r"\b40[0134]\b")
+
+
+def _is_retryable_error(exc):
+    # Rate limits and server-side hiccups deserve another attempt; anything
+    # that looks like a client error (untranslatable input, bad credentials)
+    # will fail identically every time, so fail fast instead of sleeping
+    # through the retry budget.
+    if _is_rate_limit_error(exc):
+        return True
+    text = f"{type(exc).__name__} {exc}".lower()
+    return not _CLIENT_ERROR_RE.search(text)
+
+
+def _backoff_delay(prev, cap=30.0, base=0.5):
+    """Decorrelated jitter: min(cap, uniform(base, prev*3)).
+
+    Spreads concurrent retries out instead of letting every worker hammer
+    the provider again on the same linear schedule.
+    """
+    return min(cap, random.uniform(base, prev * 3))
+
+
+class TranslationCache:
+    """On-disk memo of (src, tgt, line) -> translated line, shared across runs.
+
+    Subtitle files repeat phrases constantly ("Yeah.", speaker names, show
+    intros); caching collapses every repeat to a local lookup instead of a
+    network request. Safe to share between the file worker threads.
+    """
+
+    def __init__(self, path, src, tgt):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS tr (k BLOB PRIMARY KEY, v TEXT)")
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._src = src
+        self._tgt = tgt
+        # In-process layers: lru_cache bounds repeated disk lookups, the
+        # overlay holds rows inserted this run (lru_cache has no insert API).
+        self._lookup = functools.lru_cache(maxsize=4096)(self._select)
+        self._fresh = {}
+
+    def _key(self, line):
+        return hashlib.blake2b(
+            f"{self._src}|{self._tgt}|{line}".encode("utf-8"), digest_size=16
+        ).digest()
+
+    def _select(self, line):
+        row = self._conn.execute(
+            "SELECT v FROM tr WHERE k=?", (self._key(line),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def get(self, line):
+        with self._lock:
+            hit = self._fresh.get(line)
+            if hit is not None:
+                return hit
+            return self._lookup(line)
+
+    def put(self, line, translated):
+        # Commit per insert: a row only arrives after a network round-trip,
+        # next to which the commit cost is noise, and rows survive even when
+        # the owner never gets around to close() (process_videos rebuilds
+        # the translator per file).
+        with self._lock:
+            self._fresh[line] = translated
+            self._conn.execute(
+                "INSERT OR IGNORE INTO tr (k, v) VALUES (?, ?)",
+                (self._key(line), translated),
+            )
+            self._conn.commit()
+
+    def close(self):
+        # Idempotent: main() and load_translator may both tidy up the same
+        # instance.
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
+
 
 def parse_args():
     ap = argparse.ArgumentParser(description="Batch-translate SRT files to another language while preserving timestamps.")
@@ -40,122 +227,592 @@ def parse_args():
     ap.add_argument("output_dir", help="Directory where translated .srt files will be written.")
     ap.add_argument("--src", default="en", help="Source language code (default: en)." )
     ap.add_argument("--tgt", default="es", help="Target language code (default: es for Spanish)." )
-    ap.add_argument("--backend", choices=["google","libre","deepl"], default="google", help="Translation backend.")
-    ap.add_argument("--sleep", type=float, default=0.4, help="Seconds to wait between requests (avoid rate-limits)." )
+    ap.add_argument("--backend", choices=["google","google-async","libre","deepl","pool"], default="google", help="Translation backend; 'pool' spreads requests across several free providers.")
+    ap.add_argument("--sleep", type=float, default=0.4, help="Seconds to wait between requests; only used when --rate is 0." )
+    ap.add_argument("--rate", type=float, default=10.0, help="Target requests per second for the token-bucket limiter; 0 falls back to fixed --sleep pacing.")
+    ap.add_argument("--burst", type=float, default=None, help="Token bucket capacity (burst size); defaults to --rate.")
+    ap.add_argument("--workers", type=int, default=4, help="Files translated in parallel (translation is network-bound).")
     ap.add_argument("--libre-url", default=None, help="LibreTranslate endpoint URL, e.g., https://translate.argosopentech.com/" )
     ap.add_argument("--libre-api-key", default=None, help="LibreTranslate API key if your server requires one." )
     ap.add_argument("--deepl-api-key", default=None, help="DeepL API key (or set DEEPL_API_KEY env var)." )
     ap.add_argument("--overwrite", action="store_true", help="Overwrite existing outputs.")
+    ap.add_argument("--cache-path", default=str(DEFAULT_CACHE_PATH), help="SQLite file reused across runs to avoid re-translating identical lines.")
+    ap.add_argument("--no-cache", action="store_true", help="Disable the persistent translation cache.")
     return ap.parse_args()
 
-def load_translator(backend, src, tgt, libre_url=None, libre_api_key=None, deepl_api_key=None):
-    global TranslatorImpl
+def _build_google(src, tgt):
+    import requests
+    from deep_translator import GoogleTranslator
+
+    # deep-translator issues its HTTP calls through its module's
+    # `requests` attribute; swap in a pooled keep-alive session so the
+    # TCP/TLS connection survives across calls instead of paying a
+    # handshake per request.
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    gt_module = sys.modules[GoogleTranslator.__module__]
+    if getattr(gt_module, "requests", None) is not None:
+        gt_module.requests = session
+
+    # One translator instance per worker thread, created once and reused;
+    # the instances are not documented as thread-safe, so they are not
+    # shared across the file workers.
+    thread_state = threading.local()
+
+    def _translator():
+        gt = getattr(thread_state, "gt", None)
+        if gt is None:
+            gt = GoogleTranslator(source=src, target=tgt)
+            thread_state.gt = gt
+        return gt
+
+    class GT:
+        def translate(self, lines):
+            # Pack the whole batch into one request joined by BATCH_MARKER;
+            # one HTTP round-trip instead of one per line.
+            gt = _translator()
+            if len(lines) == 1:
+                return [gt.translate(lines[0])]
+            joined = BATCH_MARKER.join(lines)
+            result = gt.translate(joined)
+            pieces = [piece.strip() for piece in result.split(BATCH_MARKER.strip())]
+            if len(pieces) != len(lines):
+                # Marker was mangled by the service; fall back to per-line calls.
+                return [gt.translate(ln) for ln in lines]
+            return pieces
+    return GT()
+
+
+def _build_google_async(src, tgt):
+    # pip install aiohttp
+    import asyncio
+    import aiohttp
+
+    endpoint = "https://translate.googleapis.com/translate_a/single"
+
+    async def _translate_line(sem, session, text):
+        params = {"client": "gtx", "sl": src, "tl": tgt, "dt": "t", "q": text}
+        async with sem:
+            async with session.get(endpoint, params=params) as resp:
+                resp.raise_for_status()
+                payload = await resp.json(content_type=None)
+        return "".join(part[0] for part in payload[0] if part[0])
+
+    async def _translate_all(lines):
+        sem = asyncio.Semaphore(8)
+        connector = aiohttp.TCPConnector(limit_per_host=8)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            tasks = [_translate_line(sem, session, ln) for ln in lines]
+            return list(await asyncio.gather(*tasks))
+
+    class GTAsync:
+        def translate(self, lines):
+            # Batch flies concurrently over one keep-alive connection,
+            # bounded by the semaphore so we stay polite to the endpoint.
+            return asyncio.run(_translate_all(lines))
+    return GTAsync()
+
+
+def _build_libre(src, tgt, libre_url, libre_api_key):
+    import requests
+
+    endpoint = libre_url.rstrip("/") + "/translate"
+    lt_session = requests.Session()
+
+    class LT:
+        def translate(self, lines):
+            # LibreTranslate's /translate accepts q as a JSON array and
+            # answers with an array in the same order: the whole batch
+            # costs one HTTP request instead of one per line.
+            payload = {"q": list(lines), "source": src, "target": tgt, "format": "text"}
+            if libre_api_key:
+                payload["api_key"] = libre_api_key
+            resp = lt_session.post(endpoint, json=payload, timeout=60)
+            resp.raise_for_status()
+            translated = resp.json()["translatedText"]
+            if isinstance(translated, str):
+                # Single-string q gets a single-string answer.
+                translated = [translated]
+            return translated
+    return LT()
+
+
+def _build_deepl(src, tgt, key):
+    import deepl
+
+    translator = deepl.Translator(key)
+
+    class DL:
+        def translate(self, lines):
+            # deepl's translate_text is natively batch-aware for lists.
+            res = translator.translate_text(lines, source_lang=src.upper(), target_lang=tgt.upper())
+            return [r.text for r in res]
+    return DL()
+
+
+def _mymemory_locale(code):
+    """Map a bare ISO 639-1 code to a MyMemory locale (en -> en-GB).
+
+    deep-translator's MyMemoryTranslator rejects bare codes outright; it
+    only accepts region-qualified locales. Codes that already carry a
+    region pass through untouched, as do codes with no known locale.
+    """
+    if "-" in code:
+        return code
+    from deep_translator.constants import MY_MEMORY_LANGUAGES_TO_CODES
+
+    for locale in MY_MEMORY_LANGUAGES_TO_CODES.values():
+        if locale.split("-", 1)[0] == code:
+            return locale
+    return code
+
+
+def _build_mymemory(src, tgt):
+    from deep_translator import MyMemoryTranslator
+
+    src = _mymemory_locale(src)
+    tgt = _mymemory_locale(tgt)
+    thread_state = threading.local()
+
+    def _translator():
+        mm = getattr(thread_state, "mm", None)
+        if mm is None:
+            mm = MyMemoryTranslator(source=src, target=tgt)
+            thread_state.mm = mm
+        return mm
+
+    class MM:
+        def translate(self, lines):
+            # MyMemory has no batch form; it contributes per-line capacity
+            # from a quota independent of Google's.
+            return [_translator().translate(ln) for ln in lines]
+    return MM()
+
+
+class ProviderPool:
+    """Spread requests over independent providers to multiply the rate limit.
+
+    Each provider keeps its own token bucket (its own quota) and a circuit
+    breaker: translate() sends the batch to the healthy provider with the
+    most tokens, and a provider that rate-limits is benched for 60s while
+    the others keep working.
+    """
+
+    BREAK_FOR = 60.0
+
+    def __init__(self, providers):
+        # providers: list of (name, impl, TokenBucket)
+        self._providers = list(providers)
+        self._broken_until = {}
+        self._lock = threading.Lock()
+
+    def _pick(self):
+        now = time.monotonic()
+        with self._lock:
+            healthy = [
+                p for p in self._providers
+                if self._broken_until.get(p[0], 0.0) <= now
+            ]
+        candidates = healthy or self._providers
+        return max(candidates, key=lambda p: p[2].available())
+
+    def translate(self, lines):
+        last_error = None
+        for _ in range(len(self._providers)):
+            name, impl, bucket = self._pick()
+            bucket.acquire()
+            try:
+                return impl.translate(lines)
+            except Exception as e:
+                if not _is_rate_limit_error(e):
+                    raise
+                last_error = e
+                bucket.throttle()
+                with self._lock:
+                    self._broken_until[name] = time.monotonic() + self.BREAK_FOR
+        raise last_error
+
+
+def load_translator(backend, src, tgt, libre_url=None, libre_api_key=None, deepl_api_key=None, cache_path=str(DEFAULT_CACHE_PATH), rate=10.0):
+    global TranslatorImpl, CACHE
+    if CACHE is not None:
+        # Callers like process_videos rebuild the translator per file; close
+        # the old connection instead of letting GC roll its state back.
+        CACHE.close()
+    CACHE = None
+    if cache_path:
+        try:
+            CACHE = TranslationCache(cache_path, src, tgt)
+        except Exception as e:
+            print(f"⚠️  Translation cache unavailable ({e}); continuing without it.", file=sys.stderr)
     if backend == "google":
-        from deep_translator import GoogleTranslator
-        class GT:
-            def translate(self, text):
-                # deep_translator handles \n fine; for long lines we do small chunks
-                return GoogleTranslator(source=src, target=tgt).translate(text)
-        TranslatorImpl = GT()
+        TranslatorImpl = _build_google(src, tgt)
+    elif backend == "google-async":
+        TranslatorImpl = _build_google_async(src, tgt)
     elif backend == "libre":
-        # pip install libretranslatepy
-        from libretranslatepy import LibreTranslateAPI
         if not libre_url:
             raise SystemExit("--libre-url is required for backend=libre (e.g., https://translate.astian.org/)")
-        lt = LibreTranslateAPI(libre_url, api_key=libre_api_key)
-        class LT:
-            def translate(self, text):
-                return lt.translate(text, source=src, target=tgt)
-        TranslatorImpl = LT()
+        TranslatorImpl = _build_libre(src, tgt, libre_url, libre_api_key)
     elif backend == "deepl":
-        import deepl
         key = deepl_api_key or os.environ.get("DEEPL_API_KEY")
         if not key:
             raise SystemExit("DeepL backend selected but no API key provided. Set DEEPL_API_KEY or use --deepl-api-key.")
-        translator = deepl.Translator(key)
-        class DL:
-            def translate(self, text):
-                res = translator.translate_text(text, source_lang=src.upper(), target_lang=tgt.upper())
-                return res.text
-        TranslatorImpl = DL()
+        TranslatorImpl = _build_deepl(src, tgt, key)
+    elif backend == "pool":
+        providers = [
+            ("google", _build_google(src, tgt)),
+            ("mymemory", _build_mymemory(src, tgt)),
+        ]
+        if libre_url:
+            providers.append(("libre", _build_libre(src, tgt, libre_url, libre_api_key)))
+        key = deepl_api_key or os.environ.get("DEEPL_API_KEY")
+        if key:
+            providers.append(("deepl", _build_deepl(src, tgt, key)))
+        TranslatorImpl = ProviderPool(
+            [(name, impl, TokenBucket(rate)) for name, impl in providers]
+        )
     else:
         raise ValueError("Unknown backend")
 
 
-def translate_text_preserving_newlines(text, sleep_duration=0.4):
-    # Split on lines to avoid very long requests; keep empty lines.
-    lines = text.split("\n")
-    out_lines = []
+def _batched_lines(lines):
+    """Group lines into batches bounded by line count and total chars."""
+    batch = []
+    chars = 0
     for ln in lines:
-        if ln.strip() == "":
-            out_lines.append(ln)
-            continue
-        # Retry logic
-        for attempt in range(5):
+        if batch and (len(batch) >= MAX_BATCH_LINES
+                      or chars + len(ln) + len(BATCH_MARKER) > MAX_BATCH_CHARS):
+            yield batch
+            batch = []
+            chars = 0
+        batch.append(ln)
+        chars += len(ln) + len(BATCH_MARKER)
+    if batch:
+        yield batch
+
+
+def _translate_batch(lines):
+    # Retry logic at the batch level, decorrelated-jitter backoff.
+    delay = 0.5
+    for attempt in range(5):
+        if RATE_LIMITER is not None:
+            RATE_LIMITER.acquire()
+        try:
+            return TranslatorImpl.translate(lines)
+        except Exception as e:
+            if RATE_LIMITER is not None and _is_rate_limit_error(e):
+                RATE_LIMITER.throttle()
+            if attempt == 4 or not _is_retryable_error(e):
+                raise
+            delay = _backoff_delay(delay)
+            time.sleep(delay)
+
+
+class BatchingDispatcher:
+    """Single line queue fed by every file worker, drained by a small pool.
+
+    Each drain worker takes one pending line, then lingers briefly to group
+    whatever else has queued up (across files) into the same backend request,
+    bounded by the usual batch limits. Callers get a Future per line, so short
+    files no longer pay a full round-trip for a handful of cues while longer
+    files keep the pipeline busy.
+    """
+
+    def __init__(self, workers=4, linger=0.05, sleep_duration=0.0):
+        self._queue = queue.Queue()
+        self._linger = linger
+        self._sleep = sleep_duration
+        self._threads = [
+            threading.Thread(target=self._drain, daemon=True)
+            for _ in range(max(1, workers))
+        ]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, line):
+        future = concurrent.futures.Future()
+        self._queue.put((line, future))
+        return future
+
+    def close(self):
+        for _ in self._threads:
+            self._queue.put(None)
+        for t in self._threads:
+            t.join()
+
+    def _next_batch(self):
+        item = self._queue.get()
+        if item is None:
+            return None
+        batch = [item]
+        chars = len(item[0])
+        deadline = time.monotonic() + self._linger
+        while len(batch) < MAX_BATCH_LINES and chars < MAX_BATCH_CHARS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
             try:
-                translated = TranslatorImpl.translate(ln)
-                out_lines.append(translated)
+                extra = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if extra is None:
+                # Re-post the sentinel so sibling workers also shut down.
+                self._queue.put(None)
                 break
+            batch.append(extra)
+            chars += len(extra[0]) + len(BATCH_MARKER)
+        return batch
+
+    def _drain(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                translated = _translate_batch([ln for ln, _ in batch])
             except Exception as e:
-                if attempt == 4:
-                    raise
-                time.sleep(0.8 * (attempt + 1))
-        # Use provided sleep duration instead of global args
-        time.sleep(sleep_duration)
-    return "\n".join(out_lines)
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            if len(translated) != len(batch):
+                # A miscounted response cannot be trusted to line up with the
+                # submitted lines; fail the whole batch rather than resolve
+                # some futures with misaligned text and strand the rest
+                # (translate_many waits on each future without a timeout).
+                error = RuntimeError(
+                    f"backend returned {len(translated)} translations "
+                    f"for {len(batch)} lines"
+                )
+                for _, future in batch:
+                    future.set_exception(error)
+                continue
+            for (_, future), tr in zip(batch, translated):
+                future.set_result(tr)
+            if self._sleep:
+                time.sleep(self._sleep)
 
 
-def translate_srt(content, sleep_duration=0.4):
-    # Walk blocks, translate only the text part.
-    out_parts = []
+def translate_many(texts, sleep_duration=0.4):
+    # Translate a list of cue texts while keeping each text's line structure.
+    # All pending lines across all texts share one batching pass, so batches
+    # fill up across block boundaries instead of resetting per cue.
+    out_texts = [t.split("\n") for t in texts]
+    # Map each distinct pending line to every position it occupies, so
+    # repeated lines ("- Yeah.", speaker names) translate exactly once.
+    positions = {}
+    for ti, lines in enumerate(out_texts):
+        for li, ln in enumerate(lines):
+            if ln.strip() == "" or NOOP_LINE_RE.match(ln):
+                continue
+            cached = CACHE.get(ln) if CACHE is not None else None
+            if cached is not None:
+                lines[li] = cached
+                continue
+            positions.setdefault(ln, []).append((ti, li))
+
+    def _apply(ln, tr):
+        for ti, li in positions[ln]:
+            out_texts[ti][li] = tr
+        if CACHE is not None:
+            CACHE.put(ln, tr)
+
+    if DISPATCHER is not None:
+        # Route through the shared dispatcher; it owns batching and pacing.
+        submitted = [(ln, DISPATCHER.submit(ln)) for ln in positions]
+        for ln, future in submitted:
+            _apply(ln, future.result())
+    else:
+        for batch in _batched_lines(list(positions)):
+            translated = _translate_batch(batch)
+            for ln, tr in zip(batch, translated):
+                _apply(ln, tr)
+            # Fixed pacing only applies without a rate limiter; the token
+            # bucket already spaces requests out.
+            if RATE_LIMITER is None:
+                time.sleep(sleep_duration)
+    return ["\n".join(lines) for lines in out_texts]
+
+
+def translate_text_preserving_newlines(text, sleep_duration=0.4):
+    # Single-text convenience wrapper kept for existing callers.
+    return translate_many([text], sleep_duration=sleep_duration)[0]
+
+
+def _extract_blocks_re(data):
+    # Backtracking-regex fallback for chunks the fast path cannot make sense of.
+    return [
+        (m.group(1), m.group(2), m.group(3), m.group(4))
+        for m in SRT_BLOCK_RE_B.finditer(data)
+    ]
+
+
+def _iter_chunks(data):
+    # Carve block-sized chunks straight out of the buffer; slicing a mmap
+    # copies one block at a time, never the whole file.
     pos = 0
-    for m in SRT_BLOCK_RE.finditer(content):
-        start, end = m.span()
-        out_parts.append(content[pos:start])  # anything before the block (usually nothing)
-        idx = m.group(1)
-        t1 = m.group(2)
-        t2 = m.group(3)
-        txt = m.group(4)
-        translated_txt = translate_text_preserving_newlines(txt, sleep_duration=sleep_duration)
-        block = f"{idx}\n{t1} --> {t2}\n{translated_txt}\n\n"
-        out_parts.append(block)
-        pos = end
-    out_parts.append(content[pos:])  # tail
-    return "".join(out_parts)
+    for sep in BLOCK_SEP_RE_B.finditer(data):
+        yield data[pos:sep.start()]
+        pos = sep.end()
+    yield data[pos:]
+
+
+def extract_blocks(data):
+    """Single scan over SRT bytes; returns (index, start, end, text) tuples.
+
+    The SRT grammar is trivial — index line, timestamp line, text until a
+    blank line — so a straight split parser beats the non-greedy regex by a
+    wide margin on long files. Malformed chunks fall back to the regex.
+    """
+    blocks = []
+    for chunk in _iter_chunks(data):
+        # CRLF normalizes to LF per chunk so \r never leaks into timestamps
+        # or cue text without materializing a normalized copy of the input.
+        chunk = bytes(chunk).replace(b"\r\n", b"\n")
+        if not chunk.strip():
+            continue
+        lines = chunk.lstrip(b"\n").split(b"\n", 2)
+        idx = lines[0].strip()
+        ts = lines[1].strip() if len(lines) > 1 else b""
+        if not idx.isdigit() or b"-->" not in ts:
+            blocks.extend(_extract_blocks_re(chunk))
+            continue
+        t1, _, t2 = ts.partition(b"-->")
+        txt = lines[2] if len(lines) > 2 else b""
+        blocks.append((idx, t1.strip(), t2.strip(), txt))
+    return blocks
+
+
+def translate_srt_iter(data, sleep_duration=0.4):
+    """Yield translated SRT output one block of bytes at a time.
+
+    Two phases: extract every block in one scan, then translate all cue
+    texts together so batching applies across the whole file. Index and
+    timestamp bytes are copied through verbatim; only text is decoded.
+    Reassembly streams block by block, so a file writer never holds the
+    whole translated output in memory.
+    """
+    blocks = extract_blocks(data)
+    texts = [txt.decode("utf-8", "ignore").rstrip("\n") for _, _, _, txt in blocks]
+    translated_texts = translate_many(texts, sleep_duration=sleep_duration)
+    for (idx, t1, t2, _), tt in zip(blocks, translated_texts):
+        yield b"".join(
+            (idx, b"\n", t1, b" --> ", t2, b"\n", tt.encode("utf-8"), b"\n\n")
+        )
+
+
+def translate_srt(content, sleep_duration=0.4):
+    # In-memory convenience wrapper over translate_srt_iter. Accepts str for
+    # callers that already decoded the file and returns the same type it was
+    # given.
+    return_str = isinstance(content, str)
+    data = content.encode("utf-8") if return_str else content
+    result = b"".join(translate_srt_iter(data, sleep_duration=sleep_duration))
+    return result.decode("utf-8") if return_str else result
+
+
+def _translate_file(src_path, out_path, sleep_duration):
+    # Copy-and-patch over a memory map: block extraction scans the mapped
+    # source chunk by chunk and translated blocks stream straight to the
+    # output handle. Peak memory is the parsed blocks — about one copy of the
+    # file — rather than a normalized input copy plus a fully assembled
+    # output. Blocks land in a sibling temp file renamed over out_path only
+    # on success: a failed translation never leaves a truncated output that a
+    # rerun would skip as finished, and an in-place run (output_dir ==
+    # input_dir with --overwrite) never truncates the bytes still mapped.
+    with open(src_path, "rb") as src:
+        if os.fstat(src.fileno()).st_size == 0:
+            out_path.write_bytes(b"")
+            return
+        tmp_path = out_path.with_name(out_path.name + ".part")
+        try:
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with open(tmp_path, "wb") as out:
+                    out.writelines(
+                        translate_srt_iter(mm, sleep_duration=sleep_duration)
+                    )
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    os.replace(tmp_path, out_path)
+
+
+def _process_file(p, out_dir, overwrite, sleep):
+    """Translate one SRT file in place on disk; returns (path, status, error)."""
+    out_path = out_dir / p.name  # keep same filename
+    if out_path.exists() and not overwrite:
+        return p, "skipped", None
+    try:
+        _translate_file(p, out_path, sleep)
+        return p, "done", None
+    except Exception as e:
+        return p, "failed", e
 
 
 def main():
-    global args
+    global DISPATCHER, RATE_LIMITER
     args = parse_args()
+    # The pool backend paces each provider with its own bucket, so a global
+    # limiter would just cap it back down to a single provider's budget.
+    RATE_LIMITER = (
+        TokenBucket(args.rate, args.burst)
+        if args.rate > 0 and args.backend != "pool"
+        else None
+    )
     in_dir = Path(args.input_dir).expanduser().resolve()
     out_dir = Path(args.output_dir).expanduser().resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    load_translator(args.backend, args.src, args.tgt, args.libre_url, args.libre_api_key, args.deepl_api_key)
+    load_translator(args.backend, args.src, args.tgt, args.libre_url, args.libre_api_key, args.deepl_api_key,
+                    cache_path=None if args.no_cache else args.cache_path,
+                    rate=args.rate if args.rate > 0 else 10.0)
 
-    srt_files = sorted([p for p in in_dir.iterdir() if p.suffix.lower() == ".srt"])  # only .srt
+    # scandir hands back entries with cached metadata, one pass, no extra stats.
+    with os.scandir(in_dir) as entries:
+        srt_files = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file() and entry.name.lower().endswith(".srt")
+        )
     if not srt_files:
         print("No .srt files found in", in_dir)
         return 0
 
     total = len(srt_files)
     done = 0
-    for p in srt_files:
-        out_path = out_dir / p.name  # keep same filename
-        if out_path.exists() and not args.overwrite:
-            print(f"⏭️  Skipping existing: {out_path.name}")
-            done += 1
-            continue
-        try:
-            content = p.read_text(encoding="utf-8", errors="ignore")
-            translated = translate_srt(content)
-            out_path.write_text(translated, encoding="utf-8")
-            print(f"✅ Translated: {p.name} -> {out_path}")
-            done += 1
-        except Exception as e:
-            print(f"❌ Failed: {p.name}: {{e}}", file=sys.stderr)
-    print(f"\nDone {done}/{total} files. Output: {{out_dir}}" )
-    return 0
+    failed = 0
+    # Lines from every in-flight file funnel into one dispatcher so batches
+    # fill across file boundaries.
+    DISPATCHER = BatchingDispatcher(
+        workers=max(1, args.workers),
+        sleep_duration=args.sleep if RATE_LIMITER is None and args.backend != "pool" else 0.0,
+    )
+    # Files are independent and translation is I/O-bound on HTTP, so a small
+    # thread pool overlaps their network waits.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        futures = [
+            executor.submit(_process_file, p, out_dir, args.overwrite, args.sleep)
+            for p in srt_files
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            p, status, error = future.result()
+            if status == "skipped":
+                print(f"⏭️  Skipping existing: {p.name}")
+                done += 1
+            elif status == "done":
+                print(f"✅ Translated: {p.name} -> {out_dir / p.name}")
+                done += 1
+            else:
+                print(f"❌ Failed: {p.name}: {error}", file=sys.stderr)
+                failed += 1
+    DISPATCHER.close()
+    DISPATCHER = None
+    RATE_LIMITER = None
+    if CACHE is not None:
+        CACHE.close()
+    print(f"\nDone {done}/{total} files. Output: {out_dir}")
+    return 1 if failed else 0
 
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 import os
+import queue
 import sys
 import shutil
 import subprocess
 import argparse
+import threading
 from pathlib import Path
 import time
 
@@ -16,6 +18,56 @@ except ImportError:
     sys.path.append(str(current_dir))
     import local_translate_srt
 
+# Shared in-process model; loaded once and reused across every video instead
+# of paying the CLI's model reload per invocation. False marks "unavailable".
+_WHISPER_MODEL = None
+_WHISPER_BATCHED = False
+
+
+def _load_faster_whisper():
+    """Return the shared faster-whisper model, or None when unavailable."""
+    global _WHISPER_MODEL, _WHISPER_BATCHED
+    if _WHISPER_MODEL is None:
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            _WHISPER_MODEL = False
+        else:
+            # int8 weights halve memory bandwidth for roughly double CPU
+            # throughput at a negligible accuracy cost; on GPU keep fp16
+            # activations alongside the int8 weights.
+            try:
+                model = WhisperModel("small", device="cuda", compute_type="int8_float16")
+            except Exception:
+                model = WhisperModel("small", device="cpu", compute_type="int8")
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                pass
+            else:
+                model = BatchedInferencePipeline(model=model)
+                _WHISPER_BATCHED = True
+            _WHISPER_MODEL = model
+    return _WHISPER_MODEL or None
+
+
+def _format_srt_timestamp(seconds):
+    total_ms = max(0, int(round(seconds * 1000)))
+    hours, rem = divmod(total_ms, 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    secs, ms = divmod(rem, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{ms:03d}"
+
+
+def _write_segments_srt(segments, srt_path):
+    """Write faster-whisper segments out as a standard SRT file."""
+    with open(srt_path, "w", encoding="utf-8") as f:
+        for i, segment in enumerate(segments, 1):
+            f.write(f"{i}\n")
+            f.write(f"{_format_srt_timestamp(segment.start)} --> {_format_srt_timestamp(segment.end)}\n")
+            f.write(f"{segment.text.strip()}\n\n")
+
+
 def check_whisper_installed():
     """Check if whisper is available in the path."""
     whisper_bin = shutil.which("whisper")
@@ -24,24 +76,46 @@ def check_whisper_installed():
         venv_whisper = Path.home() / "venvs" / "whisper" / "bin" / "whisper"
         if venv_whisper.exists():
             return str(venv_whisper)
-        else:
-            print("Error: 'whisper' command not found. Please ensure it is installed and in your PATH, or in ~/venvs/whisper/bin/whisper")
-            sys.exit(1)
+        if _load_faster_whisper() is not None:
+            # In-process backend needs no CLI binary at all.
+            return None
+        print("Error: 'whisper' command not found. Please ensure it is installed and in your PATH, or in ~/venvs/whisper/bin/whisper")
+        sys.exit(1)
     return whisper_bin
 
 def generate_english_subtitle(video_path, whisper_bin):
     """Generates English subtitle using Whisper."""
     print(f"🎤 Generating English subtitles for: {video_path.name}")
-    
+
+    expected_srt_lang = video_path.with_suffix(".en.srt")
+
+    # Preferred path: in-process faster-whisper (CTranslate2). The model loads
+    # once for the whole batch and vad_filter skips silent stretches.
+    model = _load_faster_whisper()
+    if model is not None:
+        try:
+            transcribe_kwargs = {"language": "en", "vad_filter": True, "beam_size": 5}
+            if _WHISPER_BATCHED:
+                transcribe_kwargs["batch_size"] = 16
+            segments, _info = model.transcribe(str(video_path), **transcribe_kwargs)
+            _write_segments_srt(segments, expected_srt_lang)
+            return expected_srt_lang
+        except Exception as e:
+            if whisper_bin is None:
+                # check_whisper_installed returned None because only the
+                # in-process backend exists; there is no CLI to fall back to.
+                print(f"❌ faster-whisper failed for {video_path.name}: {e} (no whisper CLI installed to fall back to)")
+                return None
+            print(f"⚠️  faster-whisper failed for {video_path.name}: {e}; falling back to the whisper CLI")
+
     # Whisper command
-    # whisper "video.mp4" --task transcribe --language en --model small --fp16 False --output_format srt
+    # whisper "video.mp4" --task transcribe --language en --model small --output_format srt
     cmd = [
         whisper_bin,
         str(video_path),
         "--task", "transcribe",
         "--language", "en",
         "--model", "small",
-        "--fp16", "False",
         "--output_format", "srt",
         "--output_dir", str(video_path.parent) # Ensure output is in the same directory
     ]
@@ -57,10 +131,8 @@ def generate_english_subtitle(video_path, whisper_bin):
         # We will look for the most recently created .srt file matching the video name.
         
         expected_srt = video_path.with_suffix(".srt")
-        
+
         # If whisper included language code in filename (e.g. video.en.srt)
-        expected_srt_lang = video_path.with_suffix(".en.srt")
-        
         if expected_srt_lang.exists():
             return expected_srt_lang
         elif expected_srt.exists():
@@ -134,14 +206,17 @@ def process_directory(directory_path, force=False):
     
     print(f"📂 Scanning directory: {root_dir}")
     
-    # Support both lowercase and uppercase extension
-    videos = sorted(list(root_dir.glob("*.mp4")) + list(root_dir.glob("*.MP4")))
-    
-    # Remove duplicates just in case (e.g. case-insensitive FS)
-    videos = sorted(list(set(videos)))
-    
+    # One scandir pass with a case-insensitive suffix check covers upper and
+    # lowercase extensions without the double glob + set() dedup dance.
+    with os.scandir(root_dir) as entries:
+        videos = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file() and entry.name.lower().endswith((".mp4", ".mkv"))
+        )
+
     if not videos:
-        print(f"❌ No .mp4 videos found in: {root_dir}")
+        print(f"❌ No .mp4/.mkv videos found in: {root_dir}")
         print("   If your videos are elsewhere, please provide the full path in the menu.")
         return 1
 
@@ -152,12 +227,26 @@ def process_directory(directory_path, force=False):
     sub_en_dir.mkdir(exist_ok=True)
 
     print(f"Found {len(videos)} videos. Starting process...\n")
-    
+
+    # Two-stage pipeline: this thread (producer) runs Whisper per video and
+    # enqueues finished English subtitles; a consumer thread drains the queue
+    # through translation, so the network cost of video i overlaps the
+    # transcription of video i+1. maxsize bounds the backlog if translation
+    # ever falls behind.
+    work_queue = queue.Queue(maxsize=2)
+    failures = []
+
+    consumer = threading.Thread(
+        target=_translate_and_organize,
+        args=(work_queue, force, failures),
+        daemon=True,
+    )
+    consumer.start()
+
     total_videos = len(videos)
     start_time = time.time()
     processed_count = 0
-    failed_count = 0
-    
+
     for i, video in enumerate(videos, 1):
         # Calculate ETA (Estimated Time of Arrival)
         if processed_count > 0:
@@ -169,27 +258,27 @@ def process_directory(directory_path, force=False):
             progress_msg = f"[{i}/{total_videos}] 🎬 Processing: {video.name} | ETA: {eta_str}"
         else:
              progress_msg = f"[{i}/{total_videos}] 🎬 Processing: {video.name} | ETA: Calculating..."
-             
+
         print("="*60)
         print(progress_msg)
         print("="*60)
-        
+
         # Desired file paths
         # Spanish subtitle (alongside video) -> VideoName.srt
         final_es_srt = video.with_suffix(".srt")
         # English subtitle (in sub_en) -> VideoName.en.srt
         final_en_srt_in_subdir = sub_en_dir / f"{video.stem}.en.srt"
-        
+
         # Check if work is already done
         if final_es_srt.exists() and final_en_srt_in_subdir.exists() and not force:
             print(f"⏭️  Skipping {video.name} (files already exist).")
             # Even if skipped, we count it for progress (it was fast)
             processed_count += 1
             continue
-            
+
         # 1. Generate English Subtitle (tmp location in root first)
         temp_en_srt = video.with_suffix(".en.srt")
-        
+
         # Check if we already have the English sub in sub_en or root
         english_source = None
         if final_en_srt_in_subdir.exists():
@@ -201,21 +290,39 @@ def process_directory(directory_path, force=False):
         else:
              # Run Whisper
              english_source = generate_english_subtitle(video, whisper_bin)
-        
+
         if not english_source or not english_source.exists():
             print("   - Skipping translation (no English source).")
-            failed_count += 1
+            failures.append(video)
             processed_count += 1
             continue
-            
-        # 2. Translate to Spanish if needed
+
+        # 2. Hand the finished English subtitle to the translation stage.
+        work_queue.put((video, english_source, final_es_srt, final_en_srt_in_subdir))
+        processed_count += 1
+
+    work_queue.put(None)
+    consumer.join()
+
+    return 1 if failures else 0
+
+
+def _translate_and_organize(work_queue, force, failures):
+    """Consumer stage: translate queued English subtitles and file them away."""
+    while True:
+        item = work_queue.get()
+        if item is None:
+            return
+        video, english_source, final_es_srt, final_en_srt_in_subdir = item
+
+        # Translate to Spanish if needed
         if not final_es_srt.exists() or force:
             if not translate_to_spanish(english_source, final_es_srt):
-                failed_count += 1
+                failures.append(video)
         else:
             print("   - Spanish subtitle already exists.")
 
-        # 3. Organize English Subtitle
+        # Organize English Subtitle
         # Move English subtitle to sub_en/ folder if it's not already there
         if english_source != final_en_srt_in_subdir:
             try:
@@ -223,13 +330,9 @@ def process_directory(directory_path, force=False):
                 print(f"📂 Moved English subtitle to: {final_en_srt_in_subdir.name}")
             except Exception as e:
                 print(f"⚠️  Failed to move English subtitle: {e}")
-                failed_count += 1
-
-        processed_count += 1
+                failures.append(video)
         print("-" * 40)
 
-    return 1 if failed_count else 0
-
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Automate subtitle generation, translation, and organization.")
     parser.add_argument("directory", nargs="?", default=".", help="Directory containing videos")
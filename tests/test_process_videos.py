@@ -57,6 +57,90 @@ class WhisperResolutionTests(unittest.TestCase):
         self.assertEqual(result, str(active_whisper))
 
 
+class FakeSegment:
+    def __init__(self, start, end, text):
+        self.start = start
+        self.end = end
+        self.text = text
+
+
+class FakeWhisperModel:
+    def __init__(self, segments):
+        self.segments = segments
+        self.calls = []
+
+    def transcribe(self, path, **kwargs):
+        self.calls.append((path, kwargs))
+        return iter(self.segments), object()
+
+
+class FasterWhisperTests(unittest.TestCase):
+    def test_formats_srt_timestamps(self):
+        self.assertEqual(
+            process_videos._format_srt_timestamp(3661.5), "01:01:01,500"
+        )
+        self.assertEqual(process_videos._format_srt_timestamp(0), "00:00:00,000")
+
+    def test_in_process_model_bypasses_the_cli(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            video = Path(temp_dir) / "lesson.mp4"
+            video.touch()
+            model = FakeWhisperModel([FakeSegment(0.0, 1.0, " Hello ")])
+
+            with (
+                patch("process_videos._load_faster_whisper", return_value=model),
+                patch("process_videos.subprocess.run") as run,
+                redirect_stdout(StringIO()),
+            ):
+                result = process_videos.generate_english_subtitle(video, None)
+
+            run.assert_not_called()
+            self.assertEqual(result, video.with_suffix(".en.srt"))
+            self.assertEqual(
+                result.read_text(encoding="utf-8"),
+                "1\n00:00:00,000 --> 00:00:01,000\nHello\n\n",
+            )
+            self.assertEqual(model.calls[0][0], str(video))
+
+    def test_model_failure_without_a_cli_fails_the_video_not_the_batch(self):
+        class BrokenModel:
+            def transcribe(self, path, **kwargs):
+                raise RuntimeError("cuDNN failed to initialize")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            video = Path(temp_dir) / "lesson.mp4"
+            video.touch()
+
+            with (
+                patch("process_videos._load_faster_whisper", return_value=BrokenModel()),
+                patch("process_videos.subprocess.run") as run,
+                redirect_stdout(StringIO()),
+            ):
+                result = process_videos.generate_english_subtitle(video, None)
+
+            run.assert_not_called()
+            self.assertIsNone(result)
+
+    def test_falls_back_to_the_cli_without_faster_whisper(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            video = Path(temp_dir) / "lesson.mp4"
+            video.touch()
+
+            def fake_run(command, check):
+                video.with_suffix(".srt").write_text(VALID_SRT, encoding="utf-8")
+                return subprocess.CompletedProcess(command, 0)
+
+            with (
+                patch("process_videos._load_faster_whisper", return_value=None),
+                patch("process_videos.subprocess.run", side_effect=fake_run) as run,
+                redirect_stdout(StringIO()),
+            ):
+                result = process_videos.generate_english_subtitle(video, "whisper")
+
+            run.assert_called_once()
+            self.assertEqual(result, video.with_suffix(".en.srt"))
+
+
 class WhisperCommandTests(unittest.TestCase):
     def test_builds_legacy_command_and_renames_whisper_output(self):
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -92,8 +176,6 @@ class WhisperCommandTests(unittest.TestCase):
                     "en",
                     "--model",
                     "small",
-                    "--fp16",
-                    "False",
                     "--output_format",
                     "srt",
                     "--output_dir",
@@ -243,9 +325,30 @@ class LegacyDirectoryProcessingTests(unittest.TestCase):
         self.assertNotEqual(result, 0)
         translate.assert_called_once()
 
-    @unittest.expectedFailure
+    def test_pipeline_translates_and_organizes_every_video(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            for stem in ("alpha", "beta"):
+                (root / f"{stem}.mp4").touch()
+                (root / f"{stem}.en.srt").write_text(VALID_SRT, encoding="utf-8")
+
+            with (
+                patch("process_videos.check_whisper_installed", return_value="whisper"),
+                patch(
+                    "process_videos.translate_to_spanish",
+                    return_value=True,
+                ) as translate,
+                redirect_stdout(StringIO()),
+            ):
+                result = process_videos.process_directory(str(root))
+
+            self.assertEqual(result, 0)
+            self.assertEqual(translate.call_count, 2)
+            for stem in ("alpha", "beta"):
+                self.assertTrue((root / "sub_en" / f"{stem}.en.srt").exists())
+                self.assertFalse((root / f"{stem}.en.srt").exists())
+
     def test_discovers_mkv_inputs(self):
-        """P0.1 reproduction: the legacy scanner only considers MP4 files."""
         with tempfile.TemporaryDirectory() as temp_dir:
             root = Path(temp_dir)
             video = root / "lesson.mkv"